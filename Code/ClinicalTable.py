@@ -7,6 +7,7 @@ KyeongsangUniversity Bacteremia Clinical Table Code
 import numpy as np
 import pandas as pd 
 import os
+from ScorePipeline import read_scored
 from scipy.stats import mannwhitneyu, chi2_contingency, fisher_exact
 from scipy import stats
 
@@ -16,10 +17,21 @@ path=r"C:\Users\user-pc\Desktop\KSU\Sepsis Research\Data\CSV"
 os.chdir(path)
 os.getcwd()
 
+#Select only the necessary columns in an organized manner
+patientColumnNames = ['Serial Number', 'Age', 'Gender', 'Volume', 'Body Temperature', 'Body Weight', 'Bacteremia Result dummy', 'Bacteremia Result', 'Bacteremia Type','Death Status', 
+                      'PaO2', 'FiO2', 'PaO2/FiO2', 'Respiratory Rate', 'Heart Rate', 'SBP', 'DBP', 'MAP', 'Arterial pH', 'K', 'Na', 'GCS Score', 'Seg Neutrophil', 
+                      'Bands Neutrophil', 'Absolute Neutrophil Count', 'Lymphocyte', 'Absolute Lymphocyte Count', 'Neutrophil Lymphocyte Ratio', 'Creatinine', 
+                      'Lactate Level', 'Bilirubin', 'AST', 'Platelets', 'BUN', 'WBC', 'Hematocrite', 'ESR', 'CRP(mg/L)', 'PCT(ng/ml)', 'Pitt Bacteremia score', 'APACHE II score', 'SOFA score',
+                      'Diabetes Mellintus', 'Hypertension', 'Heart Failure', 'Cerebrovascular Disease', 'Renal Disease', 'Liver Disease', 'COPD', 'Known Neoplasm', 'Catheter Related Bloodstream Infection', 'Intra Abdominal Infection',
+                      'Respiratory Tract Infection', 'Skin and Soft Tissue Infection', 'Urinary Tract Infection', 'Others', 'Fever of Unknown Origin','Prior Antibiotics']
+
+#Scored clinical data written by ScoreCalculator.py (.parquet or .csv)
+ScoredFile = 'ClinicalDataWithScores.parquet'
+
 #Reading the files
 BloodCultureData = pd.read_csv('BacteremiaData(2019).csv', encoding='cp949')
-ClinicalData = pd.read_csv('ClinicalDataWithScores.csv', encoding='cp949')
-ClinicalData = ClinicalData.drop(['Unnamed: 0','Registration Number', 'Age', 'Bacteremia Result'], axis=1)
+#Only the selected columns are read from the scored clinical data, Age and Bacteremia Result are taken from the blood culture data
+ClinicalData = read_scored(ScoredFile, columns=[column for column in patientColumnNames if column not in ['Age', 'Bacteremia Result']])
 
 #Merge the Clinical Data and Original Data
 BacteremiaData = pd.merge(ClinicalData, BloodCultureData, on=['Serial Number'], how = 'left')
@@ -43,13 +55,7 @@ BacteremiaData = BacteremiaData.drop(['index'], axis=1)
 #Creating a copy of BacteremiaData and name it TotalPatients
 TotalPatients = BacteremiaData.copy()
 
-#Select only the necessary columns in an organized manner
-patientColumnNames = ['Serial Number', 'Age', 'Gender', 'Volume', 'Body Temperature', 'Body Weight', 'Bacteremia Result dummy', 'Bacteremia Result', 'Bacteremia Type','Death Status', 
-                      'PaO2', 'FiO2', 'PaO2/FiO2', 'Respiratory Rate', 'Heart Rate', 'SBP', 'DBP', 'MAP', 'Arterial pH', 'K', 'Na', 'GCS Score', 'Seg Neutrophil', 
-                      'Bands Neutrophil', 'Absolute Neutrophil Count', 'Lymphocyte', 'Absolute Lymphocyte Count', 'Neutrophil Lymphocyte Ratio', 'Creatinine', 
-                      'Lactate Level', 'Bilirubin', 'AST', 'Platelets', 'BUN', 'WBC', 'Hematocrite', 'ESR', 'CRP(mg/L)', 'PCT(ng/ml)', 'Pitt Bacteremia score', 'APACHE II score', 'SOFA score',
-                      'Diabetes Mellintus', 'Hypertension', 'Heart Failure', 'Cerebrovascular Disease', 'Renal Disease', 'Liver Disease', 'COPD', 'Known Neoplasm', 'Catheter Related Bloodstream Infection', 'Intra Abdominal Infection',
-                      'Respiratory Tract Infection', 'Skin and Soft Tissue Infection', 'Urinary Tract Infection', 'Others', 'Fever of Unknown Origin','Prior Antibiotics']
+#Keep only the selected columns in an organized manner
 TotalPatients = TotalPatients[patientColumnNames]
 PositivePatients = PositivePatients[patientColumnNames]
 NegativePatients = NegativePatients[patientColumnNames]
@@ -0,0 +1,110 @@
+"""
+Created on October 18th, 2026
+KyeongsangUniversity Sepsis derived variable engine
+Oxygenation and blood count variables derived from the raw arterial blood gas and CBC records for ScoreCalculator.py
+"""
+
+import os
+import hashlib
+import numpy as np
+import pandas as pd
+from SeverityScores import compute_scores, SOFATable, APACHETable
+
+#Alveolar gas equation: PAO2 = FiO2 * (barometric pressure - water vapour pressure) - PaCO2 / respiratory quotient
+BarometricPressure = 760
+WaterVapourPressure = 47
+RespiratoryQuotient = 0.8
+
+#The gas of every patient that scores worst on these oxygenation and acid-base subscores is kept
+GasTable = {
+    'score': 'Blood Gas score',
+    'rules': {'Respiratory SOFA Subscore': SOFATable['rules']['Respiratory SOFA Subscore'],
+              'Oxygenation Subscore': APACHETable['rules']['Oxygenation Subscore'],
+              'PH Subscore': APACHETable['rules']['PH Subscore']}
+}
+GasColumns = ['FiO2', 'PaO2', 'A-aDO2', 'PaO2/FiO2', 'Arterial pH']
+
+
+def alveolar_arterial_gradient(FiO2, PaO2, PaCO2):
+    """A-aDO2 in mmHg from the inspired oxygen fraction and the arterial oxygen and carbon dioxide tensions."""
+    return np.asarray(FiO2, dtype=float) * (BarometricPressure - WaterVapourPressure) - np.asarray(PaCO2, dtype=float) / RespiratoryQuotient - np.asarray(PaO2, dtype=float)
+
+
+def derive_blood_gases(Gases):
+    """
+    Derive FiO2, A-aDO2 and PaO2/FiO2 for every record of Gases ('Serial Number', 'FiO2', 'PaO2', 'PaCO2', 'Arterial pH').
+    FiO2 recorded as a percentage (above 1) is converted to a fraction.
+    """
+    FiO2 = pd.to_numeric(Gases['FiO2'], errors='coerce').to_numpy(dtype=float)
+    FiO2 = np.where(FiO2 > 1, FiO2 / 100, FiO2)
+    PaO2 = pd.to_numeric(Gases['PaO2'], errors='coerce').to_numpy(dtype=float)
+    PaCO2 = pd.to_numeric(Gases['PaCO2'], errors='coerce').to_numpy(dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = np.where(FiO2 > 0, PaO2 / FiO2, np.nan)
+    return pd.DataFrame({'Serial Number': Gases['Serial Number'].to_numpy(), 'FiO2': FiO2, 'PaO2': PaO2,
+                         'A-aDO2': alveolar_arterial_gradient(FiO2, PaO2, PaCO2), 'PaO2/FiO2': ratio,
+                         'Arterial pH': pd.to_numeric(Gases['Arterial pH'], errors='coerce').to_numpy(dtype=float)})
+
+
+def worst_blood_gas(Gases):
+    """
+    Keep one derived gas per patient, the one with the highest sum of the GasTable subscores.
+    Ties go to the gas with the lowest PaO2/FiO2. Returns a frame indexed by Serial Number with the GasColumns.
+    """
+    Derived = derive_blood_gases(Gases)
+    points = compute_scores(Derived, [GasTable])[0][GasTable['score']].to_numpy()
+    ratio = np.nan_to_num(Derived['PaO2/FiO2'].to_numpy(), nan=np.inf)
+    patients = Derived['Serial Number'].to_numpy()
+    order = np.lexsort((ratio, -points, patients))
+    first = order[np.r_[True, patients[order][1:] != patients[order][:-1]]] if len(order) else order
+    return Derived.iloc[first].set_index('Serial Number')[GasColumns]
+
+
+def neutrophil_lymphocyte_ratio(Counts):
+    """Highest neutrophil to lymphocyte ratio per patient from CBC records ('Serial Number', 'Neutrophil', 'Lymphocyte')."""
+    Neutrophil = pd.to_numeric(Counts['Neutrophil'], errors='coerce')
+    Lymphocyte = pd.to_numeric(Counts['Lymphocyte'], errors='coerce')
+    Ratio = (Neutrophil / Lymphocyte.where(Lymphocyte > 0)).rename('Neutrophil Lymphocyte Ratio')
+    return Ratio.groupby(Counts['Serial Number'].to_numpy()).max().rename_axis('Serial Number').to_frame()
+
+
+def _file_hash(paths):
+    """md5 of the bytes of every file in paths together with the derivation settings."""
+    digest = hashlib.md5(repr([BarometricPressure, WaterVapourPressure, RespiratoryQuotient, GasTable]).encode())
+    for path in paths:
+        with open(path, 'rb') as handle:
+            for block in iter(lambda: handle.read(1 << 20), b''):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+def derived_variables(gasPath, countPath=None, cachePath=None):
+    """
+    Worst blood gas and NLR per patient from the raw ABG file gasPath and the optional CBC file countPath.
+    When cachePath is given the result is stored there with a hash of the input files and reused until they change.
+    """
+    paths = [gasPath] + ([countPath] if countPath is not None else [])
+    signature = _file_hash(paths) if cachePath is not None else None
+    if cachePath is not None and os.path.exists(cachePath):
+        #A cache without the hash or patient columns (edited by hand or from another version) is recomputed
+        Cache = pd.read_csv(cachePath)
+        if len(Cache) and {'Serial Number', 'Input Hash'} <= set(Cache.columns) and (Cache.pop('Input Hash') == signature).all():
+            return Cache.set_index('Serial Number')
+    Derived = worst_blood_gas(pd.read_csv(gasPath))
+    if countPath is not None:
+        Derived = Derived.join(neutrophil_lymphocyte_ratio(pd.read_csv(countPath)), how='outer')
+    if cachePath is not None:
+        Derived.assign(**{'Input Hash': signature}).to_csv(cachePath)
+    return Derived
+
+
+def merge_derived(Data, Derived):
+    """Overwrite the columns of Data with the derived values of the same patient, rows without a derived value are kept."""
+    Matched = Derived.reindex(Data['Serial Number'].to_numpy())
+    for column in Derived.columns:
+        values = Matched[column].to_numpy()
+        if column in Data.columns:
+            Data[column] = np.where(np.isnan(values), Data[column].to_numpy(dtype=float), values)
+        else:
+            Data[column] = values
+    return Data
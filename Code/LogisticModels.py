@@ -0,0 +1,709 @@
+"""
+Created on October 18th, 2026
+KyeongsangUniversity Bacteremia logistic regression engine
+Batched logistic regression fits used by BacteremiaTester.py
+"""
+
+from itertools import combinations
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from scipy.special import expit, logit
+from scipy.stats import norm
+from sklearn.metrics import roc_auc_score
+from sklearn.model_selection import RepeatedStratifiedKFold
+
+
+def univariate_logit(y, X, max_iterations=35, tolerance=1e-8, firth=False):
+    """
+    Fit the univariate logistic regression y ~ 1 + x of every column of X at once by Newton-Raphson, each marker is a
+    2-parameter problem solved with the closed-form inverse of its 2x2 information matrix.
+    Rows with a missing outcome or marker value are left out of that marker's fit only.
+    firth=True fits Firth's penalized likelihood instead, see irls, so separated markers keep finite estimates.
+    Returns a table indexed by the columns of X with the coefficients, Wald statistics, odds ratios and their 95% CIs
+    and the convergence diagnostics 'Converged' and 'Iterations'.
+    """
+    X = pd.DataFrame(X)
+    x = X.to_numpy(dtype=np.float64).T
+    y = np.asarray(y, dtype=np.float64)
+    observed = ~np.isnan(x) & ~np.isnan(y)
+    x = np.where(observed, x, 0)
+    y = np.where(observed, y, 0)
+    intercept = np.zeros(len(x))
+    slope = np.zeros(len(x))
+    converged = np.zeros(len(x), dtype=bool)
+    iterations = np.zeros(len(x), dtype=np.int64)
+    for iteration in range(max_iterations):
+        p = expit(intercept[:, None] + slope[:, None] * x)
+        w = np.where(observed, p * (1 - p), 0)
+        h00 = w.sum(axis=1)
+        h01 = (w * x).sum(axis=1)
+        h11 = (w * x * x).sum(axis=1)
+        det = h00 * h11 - h01 * h01
+        residual = np.where(observed, y - p, 0)
+        if firth:
+            #Hat matrix diagonal w (1, x) I^-1 (1, x)' from the closed-form 2x2 inverse
+            residual = residual + w * (h11[:, None] - 2 * h01[:, None] * x + h00[:, None] * x * x) / det[:, None] * (0.5 - p)
+        g0 = residual.sum(axis=1)
+        g1 = (residual * x).sum(axis=1)
+        step0 = (h11 * g0 - h01 * g1) / det
+        step1 = (h00 * g1 - h01 * g0) / det
+        intercept = intercept + np.where(converged, 0, step0)
+        slope = slope + np.where(converged, 0, step1)
+        iterations = iterations + ~converged
+        converged = converged | (np.maximum(np.abs(step0), np.abs(step1)) < tolerance)
+        if converged.all():
+            break
+
+    #Covariance of the slope from the information matrix at the estimate
+    p = expit(intercept[:, None] + slope[:, None] * x)
+    w = np.where(observed, p * (1 - p), 0)
+    h00 = w.sum(axis=1)
+    h01 = (w * x).sum(axis=1)
+    h11 = (w * x * x).sum(axis=1)
+    error = np.sqrt(h00 / (h00 * h11 - h01 * h01))
+    likelihood = np.where(observed, y * np.log(p) + (1 - y) * np.log1p(-p), 0).sum(axis=1)
+    if firth:
+        likelihood = likelihood + 0.5 * np.log(h00 * h11 - h01 * h01)
+    z = slope / error
+    margin = norm.ppf(0.975) * error
+    return pd.DataFrame({'Intercept': intercept, 'Coefficient': slope, 'Std Error': error, 'z': z, 'P-value': 2 * norm.sf(np.abs(z)),
+                         'Odds Ratio': np.exp(slope), '2.5%': np.exp(slope - margin), '97.5%': np.exp(slope + margin),
+                         'Log-Likelihood': likelihood, 'N': observed.sum(axis=1), 'Converged': converged, 'Iterations': iterations}, index=X.columns)
+
+
+def logit_predictions(Table, X):
+    """Predicted probabilities of every marker model of univariate_logit for the rows of X, one column per marker."""
+    X = pd.DataFrame(X)[Table.index]
+    return pd.DataFrame(expit(Table['Intercept'].to_numpy() + Table['Coefficient'].to_numpy() * X.to_numpy(dtype=np.float64)),
+                        index=X.index, columns=Table.index)
+
+
+def raw_cutoffs(Table, thresholds):
+    """
+    Probability thresholds of the univariate_logit models mapped back to biomarker units in closed form,
+    x = (logit(p) - Intercept) / Coefficient. Patients are called positive at or above the cut-off when the coefficient is
+    positive and at or below it when it is negative, the 'Direction' column holds '>=' or '<='.
+    """
+    thresholds = pd.Series(thresholds).reindex(Table.index).to_numpy(dtype=np.float64)
+    with np.errstate(divide='ignore'):
+        cutoff = (logit(thresholds) - Table['Intercept'].to_numpy()) / Table['Coefficient'].to_numpy()
+    return pd.DataFrame({'Cut-off': cutoff, 'Direction': np.where(Table['Coefficient'].to_numpy() < 0, '<=', '>=')}, index=Table.index)
+
+
+def _log_likelihood(y, eta):
+    """Bernoulli log-likelihood of the outcomes y at the linear predictor eta, stable for large |eta|."""
+    return np.sum(y * eta - np.logaddexp(0, eta))
+
+
+def _penalized_likelihood(y, design, coefficients, firth):
+    """Log-likelihood at coefficients, plus Firth's penalty half the log-determinant of the information matrix when firth."""
+    eta = design @ coefficients
+    likelihood = _log_likelihood(y, eta)
+    if firth:
+        p = expit(eta)
+        likelihood = likelihood + 0.5 * np.linalg.slogdet(design.T @ (design * (p * (1 - p))[:, None]))[1]
+    return likelihood
+
+
+def irls(y, X, start=None, max_iterations=35, tolerance=1e-8, firth=False):
+    """
+    Fit the multivariable logistic regression of y on the columns of the array X (an intercept is added in front) by
+    iteratively reweighted least squares, starting from the coefficients start (intercept first) when given.
+    Steps are halved while they lower the log-likelihood, so a warm start far from the estimate cannot diverge, and the fit
+    stops at the current coefficients when 30 halvings do not help. It has converged once the full Newton step is below
+    tolerance. firth=True maximizes Firth's penalized likelihood, whose estimates stay finite under complete or quasi-separation:
+    the score gains the hat-matrix term h (0.5 - p) and the reported log-likelihood includes the penalty.
+    Returns (coefficients, covariance, log-likelihood, diagnostics), diagnostics holding 'Converged', 'Iterations', 'Halvings'
+    (step halvings over all iterations), 'Max Score' (largest absolute score at the estimate) and 'Max Step' (largest
+    coefficient change of the last full Newton step).
+    """
+    design = np.column_stack([np.ones(len(y)), X])
+    coefficients = np.zeros(design.shape[1]) if start is None else np.asarray(start, dtype=np.float64)
+    likelihood = _penalized_likelihood(y, design, coefficients, firth)
+    converged = False
+    newton = np.zeros(design.shape[1])
+    halvings = 0
+    for iteration in range(1, max_iterations + 1):
+        p = expit(design @ coefficients)
+        w = p * (1 - p)
+        information = design.T @ (design * w[:, None])
+        residual = y - p
+        if firth:
+            #Diagonal of the hat matrix W^1/2 X (X'WX)^-1 X' W^1/2
+            residual = residual + w * np.einsum('ij,ij->i', design, np.linalg.solve(information, design.T).T) * (0.5 - p)
+        newton = np.linalg.solve(information, design.T @ residual)
+        #Convergence is judged on the full Newton step, a step damped by the halvings can be small far from the estimate
+        converged = np.abs(newton).max() < tolerance
+        step = newton
+        for halving in range(30):
+            updated = _penalized_likelihood(y, design, coefficients + step, firth)
+            if updated >= likelihood - 1e-10:
+                break
+            step = step / 2
+            halvings += 1
+        else:
+            #No damped step keeps the log-likelihood: stay at the current coefficients
+            break
+        coefficients = coefficients + step
+        likelihood = updated
+        if converged:
+            break
+    p = expit(design @ coefficients)
+    w = p * (1 - p)
+    information = design.T @ (design * w[:, None])
+    covariance = np.linalg.inv(information)
+    residual = y - p
+    if firth:
+        residual = residual + w * np.einsum('ij,ij->i', design, design @ covariance) * (0.5 - p)
+    return coefficients, covariance, likelihood, {'Converged': converged, 'Iterations': iteration, 'Halvings': halvings,
+                                                  'Max Score': np.abs(design.T @ residual).max(), 'Max Step': np.abs(newton).max()}
+
+
+def logit_fit(y, X, start=None, max_iterations=35, tolerance=1e-8, firth=False):
+    """
+    Fit the multivariable logistic regression of y on the columns of the array X with irls.
+    Returns (coefficients, standard errors, log-likelihood, converged).
+    """
+    coefficients, covariance, likelihood, diagnostics = irls(y, X, start, max_iterations, tolerance, firth)
+    return coefficients, np.sqrt(np.diag(covariance)), likelihood, diagnostics['Converged']
+
+
+def logit_model(y, X, firth=False, max_iterations=35, tolerance=1e-8):
+    """
+    Fit the multivariable logistic regression of y on all columns of X, on the patients with every column observed.
+    Returns (table indexed by 'Intercept' and the columns of X with the coefficients, Wald statistics, odds ratios and their
+    95% CIs, Series of the 'Log-Likelihood', 'AIC', 'N' and the convergence diagnostics of irls).
+    """
+    y, X = _complete_cases(y, X)
+    coefficients, covariance, likelihood, diagnostics = irls(y, X.to_numpy(dtype=np.float64), None, max_iterations, tolerance, firth)
+    error = np.sqrt(np.diag(covariance))
+    z = coefficients / error
+    margin = norm.ppf(0.975) * error
+    Table = pd.DataFrame({'Coefficient': coefficients, 'Std Error': error, 'z': z, 'P-value': 2 * norm.sf(np.abs(z)), 'Odds Ratio': np.exp(coefficients),
+                          '2.5%': np.exp(coefficients - margin), '97.5%': np.exp(coefficients + margin)}, index=['Intercept'] + list(X.columns))
+    return Table, pd.Series({'Log-Likelihood': likelihood, 'AIC': 2 * len(coefficients) - 2 * likelihood, 'N': len(y), **diagnostics})
+
+
+def model_predictions(Table, X):
+    """Predicted probabilities of a logit_model table for the rows of X, NaN where a variable is missing."""
+    X = pd.DataFrame(X)[Table.index[1:]]
+    return pd.Series(expit(Table['Coefficient'].iloc[0] + X.to_numpy(dtype=np.float64) @ Table['Coefficient'].to_numpy()[1:]), index=X.index)
+
+
+def _fit_subset(task):
+    """Fit one candidate model of the selection engines and score its AUC."""
+    y, X, start = task
+    coefficients, error, likelihood, converged = logit_fit(y, X, start)
+    auc = roc_auc_score(y, np.column_stack([np.ones(len(y)), X]) @ coefficients)
+    return coefficients, error, likelihood, converged, auc
+
+
+@contextmanager
+def _pool(workers):
+    """Map over a process pool of workers processes, workers=1 maps in this process."""
+    if workers == 1:
+        yield map
+    else:
+        with ProcessPoolExecutor(workers) as executor:
+            yield executor.map
+
+
+def _store(cache, subset, result):
+    """Keep one fit in cache with its coefficients, Wald p-values, AIC and AUC by variable name."""
+    coefficients, error, likelihood, converged, auc = result
+    names = ['Intercept'] + list(subset)
+    cache[frozenset(subset)] = {'Coefficients': dict(zip(names, coefficients)), 'P-values': dict(zip(names, 2 * norm.sf(np.abs(coefficients / error)))),
+                                'Log-Likelihood': likelihood, 'AIC': 2 * len(names) - 2 * likelihood, 'AUC': auc, 'Converged': converged}
+
+
+def _fit_models(y, X, candidates, cache, mapper):
+    """
+    Fit the variable subsets of candidates, a list of (subset, parent subset) pairs, that are not in cache yet.
+    Each fit is warm-started from the coefficients of its parent with 0 for the added variables and stored in cache keyed
+    by the frozenset of its variables, so no subset is fitted twice. Returns the cached fit of every candidate.
+    """
+    tasks = []
+    subsets = []
+    for subset, parent in candidates:
+        if frozenset(subset) in cache or frozenset(subset) in map(frozenset, subsets):
+            continue
+        start = None
+        if parent is not None and frozenset(parent) in cache:
+            Coefficients = cache[frozenset(parent)]['Coefficients']
+            start = [Coefficients['Intercept']] + [Coefficients.get(variable, 0) for variable in subset]
+        tasks.append((y, X[list(subset)].to_numpy(dtype=np.float64), start))
+        subsets.append(subset)
+    for subset, result in zip(subsets, mapper(_fit_subset, tasks)):
+        _store(cache, subset, result)
+    return [cache[frozenset(subset)] for subset, parent in candidates]
+
+
+def _complete_cases(y, X):
+    """Outcome array and marker frame restricted to the rows without a missing value, so every model uses the same patients."""
+    X = pd.DataFrame(X).reset_index(drop=True)
+    y = pd.Series(np.asarray(y, dtype=np.float64))
+    complete = (X.notna().all(axis=1) & y.notna()).to_numpy()
+    return y.to_numpy()[complete], X[complete]
+
+
+def _path_row(step, action, variable, pvalue, subset, Fit):
+    """One row of a selection path table."""
+    return {'Step': step, 'Action': action, 'Variable': variable, 'P-value': pvalue, 'Variables': ' + '.join(subset),
+            'AUC': Fit['AUC'], 'AIC': Fit['AIC'], 'Converged': Fit['Converged']}
+
+
+def stepwise_selection(y, X, enter=0.05, stay=0.10, criterion='p-value', workers=None, cache=None):
+    """
+    Forward stepwise selection of the columns of X, on the patients with every column observed.
+    Every step fits all candidate additions in parallel and adds the one with the lowest Wald p-value below enter, then
+    removes the variables whose p-value rose above stay. With criterion='aic' the addition and then the removal with the
+    lowest AIC are taken while they improve the AIC, all removals being fitted in parallel as well.
+    Fits are warm-started from the current model and memoized in cache (a dict, shareable with backward_elimination).
+    Returns the selection path: one row per addition or removal with the model's variables, AUC and AIC.
+    """
+    y, X = _complete_cases(y, X)
+    cache = {} if cache is None else cache
+    selected = []
+    visited = {frozenset()}
+    Path = []
+    with _pool(workers) as mapper:
+        Current = _fit_models(y, X, [((), None)], cache, mapper)[0]
+        while len(selected) < X.shape[1]:
+            candidates = [variable for variable in X.columns if variable not in selected]
+            Fits = _fit_models(y, X, [(tuple(selected + [variable]), tuple(selected)) for variable in candidates], cache, mapper)
+            pvalues = [Fit['P-values'][variable] for variable, Fit in zip(candidates, Fits)]
+            if criterion == 'aic':
+                best = int(np.argmin([Fit['AIC'] for Fit in Fits]))
+                accept = Fits[best]['AIC'] < Current['AIC']
+            else:
+                best = int(np.argmin(pvalues))
+                accept = pvalues[best] < enter
+            if not accept or frozenset(selected + [candidates[best]]) in visited:
+                break
+            selected.append(candidates[best])
+            visited.add(frozenset(selected))
+            Current = Fits[best]
+            Path.append(_path_row(len(Path) + 1, 'Add', candidates[best], pvalues[best], selected, Current))
+
+            while len(selected) > 1:
+                if criterion == 'aic':
+                    Fits = _fit_models(y, X, [(tuple(variable for variable in selected if variable != removed), tuple(selected)) for removed in selected], cache, mapper)
+                    worst = int(np.argmin([Fit['AIC'] for Fit in Fits]))
+                    if Fits[worst]['AIC'] >= Current['AIC']:
+                        break
+                else:
+                    worst = int(np.argmax([Current['P-values'][variable] for variable in selected]))
+                    if Current['P-values'][selected[worst]] <= stay:
+                        break
+                removed = selected[worst]
+                pvalue = Current['P-values'][removed]
+                remaining = [variable for variable in selected if variable != removed]
+                if frozenset(remaining) in visited:
+                    break
+                Current = _fit_models(y, X, [(tuple(remaining), tuple(selected))], cache, mapper)[0]
+                selected = remaining
+                visited.add(frozenset(selected))
+                Path.append(_path_row(len(Path) + 1, 'Remove', removed, pvalue, selected, Current))
+    return pd.DataFrame(Path, columns=['Step', 'Action', 'Variable', 'P-value', 'Variables', 'AUC', 'AIC', 'Converged'])
+
+
+def backward_elimination(y, X, stay=0.05, criterion='p-value', workers=None, cache=None):
+    """
+    Backward elimination from the model with every column of X, on the patients with every column observed.
+    Every step removes the variable with the highest Wald p-value while it is above stay. With criterion='aic' all
+    removals are fitted in parallel and the one with the lowest AIC is taken while it improves the AIC.
+    Fits are warm-started from the current model and memoized in cache. Returns the elimination path, the first row being
+    the full model.
+    """
+    y, X = _complete_cases(y, X)
+    cache = {} if cache is None else cache
+    selected = list(X.columns)
+    with _pool(workers) as mapper:
+        Current = _fit_models(y, X, [(tuple(selected), None)], cache, mapper)[0]
+        Path = [_path_row(0, 'Start', '', np.nan, selected, Current)]
+        while selected:
+            if criterion == 'aic':
+                Fits = _fit_models(y, X, [(tuple(variable for variable in selected if variable != removed), tuple(selected)) for removed in selected], cache, mapper)
+                worst = int(np.argmin([Fit['AIC'] for Fit in Fits]))
+                if Fits[worst]['AIC'] >= Current['AIC']:
+                    break
+            else:
+                worst = int(np.argmax([Current['P-values'][variable] for variable in selected]))
+                if Current['P-values'][selected[worst]] <= stay:
+                    break
+            removed = selected[worst]
+            pvalue = Current['P-values'][removed]
+            selected = [variable for variable in selected if variable != removed]
+            Current = _fit_models(y, X, [(tuple(selected), tuple(selected) + (removed,))], cache, mapper)[0]
+            Path.append(_path_row(len(Path), 'Remove', removed, pvalue, selected, Current))
+    return pd.DataFrame(Path, columns=['Step', 'Action', 'Variable', 'P-value', 'Variables', 'AUC', 'AIC', 'Converged'])
+
+
+#Number of subsets fitted per task of best_subsets
+SubsetChunk = 256
+
+#Number of subsets fitted between two pruning passes of the branch-and-bound search of best_subsets
+BranchRound = 1024
+
+
+def _fit_chunk(task):
+    """Log-likelihood, AUC and convergence of every subset of columns of X in one chunk of best_subsets."""
+    y, X, subsets = task
+    results = []
+    for subset in subsets:
+        coefficients, error, likelihood, converged = logit_fit(y, X[:, list(subset)])
+        results.append((likelihood, roc_auc_score(y, np.column_stack([np.ones(len(y)), X[:, list(subset)]]) @ coefficients), converged))
+    return results
+
+
+def _fit_round(y, X, subsets, mapper):
+    """Fit the subsets in chunks of SubsetChunk over mapper, one (log-likelihood, AUC, converged) per subset."""
+    tasks = [(y, X, subsets[start:start + SubsetChunk]) for start in range(0, len(subsets), SubsetChunk)]
+    return [result for chunk in mapper(_fit_chunk, tasks) for result in chunk]
+
+
+def _subset_row(names, subset, likelihood, auc, converged):
+    """One row of best_subsets."""
+    return {'Variables': ' + '.join(str(names[column]) for column in subset), 'Size': len(subset), 'AIC': 2 * (len(subset) + 1) - 2 * likelihood,
+            'AUC': auc, 'Log-Likelihood': likelihood, 'Converged': converged}
+
+
+def best_subsets(y, X, max_size=None, criterion='aic', workers=None):
+    """
+    Best subset of up to max_size columns of X (all columns when None) on the patients with every column observed.
+    With criterion='aic' a branch-and-bound search runs over the subset lattice from the full model down: every node is a
+    fitted subset whose branch holds the subsets left after removing any of its free columns, and no subset of the branch
+    fits better than the node, so a branch whose bound -2 LL(node) + 2 (smallest size + 1) cannot beat the best AIC found
+    is dropped unfitted. The first best AIC comes from forward selection up to max_size columns and the nodes are then
+    fitted BranchRound at a time over a process pool, lowest bound first.
+    The in-sample AUC has no such bound, so criterion='auc' fits every subset of up to max_size columns, size by size.
+    Returns one row per fitted subset of up to max_size columns sorted by AIC (or by AUC, highest first, with
+    criterion='auc'); with 'aic' the first row is the best subset and the other rows are the subsets fitted on the way.
+    """
+    y, X = _complete_cases(y, X)
+    names = list(X.columns)
+    values = X.to_numpy(dtype=np.float64)
+    max_size = len(names) if max_size is None else min(max_size, len(names))
+    with _pool(workers) as mapper:
+        if criterion == 'auc':
+            Rows = []
+            for size in range(1, max_size + 1):
+                subsets = list(combinations(range(len(names)), size))
+                Rows += [_subset_row(names, subset, *result) for subset, result in zip(subsets, _fit_round(y, values, subsets, mapper))]
+            Subsets = pd.DataFrame(Rows, columns=['Variables', 'Size', 'AIC', 'AUC', 'Log-Likelihood', 'Converged'])
+            return Subsets.sort_values('AUC', ascending=False, kind='mergesort').reset_index(drop=True)
+
+        #Forward selection by AIC up to max_size columns gives a first best AIC to prune against
+        Fitted = {}
+        chosen = ()
+        for size in range(1, max_size + 1):
+            subsets = [tuple(sorted(chosen + (column,))) for column in range(len(names)) if column not in chosen]
+            results = _fit_round(y, values, subsets, mapper)
+            Fitted.update((frozenset(subset), _subset_row(names, subset, *result)) for subset, result in zip(subsets, results))
+            chosen = subsets[int(np.argmax([likelihood for likelihood, auc, converged in results]))]
+        best = min(Row['AIC'] for Row in Fitted.values())
+
+        #Frontier of (bound, subset, free columns), starting from the full model with every column free
+        frontier = [(0.0, tuple(range(len(names))), tuple(range(len(names))))]
+        while frontier:
+            frontier = sorted((node for node in frontier if node[0] < best), key=lambda node: node[0])
+            nodes, frontier = frontier[:BranchRound], frontier[BranchRound:]
+            #Subsets already fitted by the forward selection are not fitted again
+            subsets = [node[1] for node in nodes if frozenset(node[1]) not in Fitted]
+            results = dict(zip(subsets, _fit_round(y, values, subsets, mapper)))
+            for bound, subset, free in nodes:
+                if subset in results:
+                    likelihood, auc, converged = results[subset]
+                    if len(subset) <= max_size:
+                        Fitted[frozenset(subset)] = _subset_row(names, subset, likelihood, auc, converged)
+                        best = min(best, Fitted[frozenset(subset)]['AIC'])
+                else:
+                    likelihood, converged = Fitted[frozenset(subset)]['Log-Likelihood'], Fitted[frozenset(subset)]['Converged']
+                #A fit stopped short of its maximum only bounds its branch by -2 LL <= 0
+                deviance = -2 * likelihood if converged else 0
+                for position, column in enumerate(free):
+                    child = tuple(other for other in subset if other != column)
+                    smallest = max(len(child) - len(free) + position + 1, 1)
+                    if child and smallest <= max_size:
+                        frontier.append((deviance + 2 * (smallest + 1), child, free[position + 1:]))
+    Subsets = pd.DataFrame(list(Fitted.values()), columns=['Variables', 'Size', 'AIC', 'AUC', 'Log-Likelihood', 'Converged'])
+    return Subsets.sort_values('AIC', kind='mergesort').reset_index(drop=True)
+
+
+#Number of resamples refitted per task of optimism_validation
+ValidationChunk = 100
+
+
+def _validate_chunk(task):
+    """Apparent and test AUC and calibration slope of the refits on one chunk of bootstrap resamples."""
+    y, X, start, seed, chunk, size, firth = task
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(chunk,)))
+    design = np.column_stack([np.ones(len(y)), X])
+    results = []
+    for resample in range(size):
+        indices = rng.integers(0, len(y), len(y))
+        if y[indices].min() == y[indices].max():
+            continue
+        coefficients, error, likelihood, converged = logit_fit(y[indices], X[indices], start, firth=firth)
+        eta = design @ coefficients
+        #The apparent calibration slope is 1 for maximum likelihood fits but shrinks below 1 with Firth's penalty
+        slope = logit_fit(y[indices], eta[indices], [0, 1])[0][1] if firth else 1.0
+        results.append((roc_auc_score(y[indices], eta[indices]), roc_auc_score(y, eta), slope, logit_fit(y, eta, [0, 1])[0][1], converged))
+    return results
+
+
+def optimism_validation(y, X, n_bootstraps=2000, seed=1, workers=None, firth=False):
+    """
+    Harrell's bootstrap internal validation of the logistic regression of y on all columns of X, on the patients with every
+    column observed. Each resample refits the model, warm-started from the full-data coefficients, and scores it on the
+    resample (apparent) and on the original patients (test). The mean difference is the optimism subtracted from the
+    full-data AUC and calibration slope. Chunks of ValidationChunk resamples run over a process pool and every chunk draws
+    from its own stream spawned from seed, so the results do not depend on the number of workers. firth=True fits the
+    full model and every refit with Firth's penalized likelihood.
+    Returns (summary indexed by 'AUC' and 'Calibration Slope' with 'Apparent', 'Optimism' and 'Corrected' columns,
+    one row per resample with 'Apparent AUC', 'Test AUC', 'Apparent Slope', 'Test Slope' and 'Converged').
+    """
+    y, X = _complete_cases(y, X)
+    values = X.to_numpy(dtype=np.float64)
+    coefficients = logit_fit(y, values, firth=firth)[0]
+    eta = np.column_stack([np.ones(len(y)), values]) @ coefficients
+    apparent = [roc_auc_score(y, eta), logit_fit(y, eta, [0, 1])[0][1] if firth else 1.0]
+    tasks = [(y, values, coefficients, seed, chunk, min(ValidationChunk, n_bootstraps - start), firth)
+             for chunk, start in enumerate(range(0, n_bootstraps, ValidationChunk))]
+    with _pool(workers) as mapper:
+        Resamples = pd.DataFrame([result for chunk in mapper(_validate_chunk, tasks) for result in chunk],
+                                 columns=['Apparent AUC', 'Test AUC', 'Apparent Slope', 'Test Slope', 'Converged'])
+    optimism = [(Resamples['Apparent AUC'] - Resamples['Test AUC']).mean(), (Resamples['Apparent Slope'] - Resamples['Test Slope']).mean()]
+    Summary = pd.DataFrame({'Apparent': apparent, 'Optimism': optimism}, index=['AUC', 'Calibration Slope'])
+    Summary['Corrected'] = Summary['Apparent'] - Summary['Optimism']
+    return Summary, Resamples
+
+
+def _fit_fold(task):
+    """Fit one training fold and return the predicted probabilities of its held-out patients."""
+    y, X, start, train, test, firth = task
+    coefficients, error, likelihood, converged = logit_fit(y[train], X[train], start, firth=firth)
+    return expit(np.column_stack([np.ones(len(test)), X[test]]) @ coefficients), converged
+
+
+def cross_validation(y, X, folds=5, repeats=10, seed=1, workers=None, firth=False):
+    """
+    Repeated stratified k-fold cross-validation of the logistic regression of y on all columns of X, on the patients with
+    every column observed. Every fold keeps the class balance of y. The folds slice one shared marker matrix, are fitted
+    warm-started from the full-data coefficients and run over a process pool, all folds of all repeats at once.
+    firth=True fits every fold with Firth's penalized likelihood.
+    Returns (one row per fold with 'Repeat', 'Fold', 'AUC' and 'Converged', out-of-fold predicted probabilities with
+    one column per repeat indexed like the complete rows of X).
+    """
+    y, X = _complete_cases(y, X)
+    values = X.to_numpy(dtype=np.float64)
+    start = logit_fit(y, values, firth=firth)[0]
+    splits = list(RepeatedStratifiedKFold(n_splits=folds, n_repeats=repeats, random_state=seed).split(values, y))
+    tasks = [(y, values, start, train, test, firth) for train, test in splits]
+    OutOfFold = pd.DataFrame(np.nan, index=X.index, columns=pd.RangeIndex(repeats, name='Repeat'))
+    Rows = []
+    with _pool(workers) as mapper:
+        for number, ((train, test), (predictions, converged)) in enumerate(zip(splits, mapper(_fit_fold, tasks))):
+            repeat, fold = divmod(number, folds)
+            OutOfFold.iloc[test, repeat] = predictions
+            Rows.append({'Repeat': repeat, 'Fold': fold, 'AUC': roc_auc_score(y[test], predictions), 'Converged': converged})
+    return pd.DataFrame(Rows, columns=['Repeat', 'Fold', 'AUC', 'Converged']), OutOfFold
+
+
+def _soft_threshold(value, threshold):
+    """Lasso shrinkage of value towards 0 by threshold."""
+    return np.sign(value) * max(abs(value) - threshold, 0)
+
+
+def _elastic_net(y, X, lambdas, alpha, max_iterations, tolerance):
+    """
+    Elastic-net logistic regression path of y on the standardized array X for the decreasing lambdas, by coordinate
+    descent on the weighted least squares approximation of every IRLS step. Each lambda is warm-started from the
+    previous solution and the sweeps run over the active variables until they settle, then once over all variables.
+    Returns the (lambdas x 1 + variables) coefficients, intercept first, and the number of IRLS steps of every lambda.
+    """
+    n, k = X.shape
+    intercept = np.log(y.mean() / (1 - y.mean()))
+    beta = np.zeros(k)
+    path = np.zeros((len(lambdas), k + 1))
+    steps = np.zeros(len(lambdas), dtype=np.int64)
+    for position, penalty in enumerate(lambdas):
+        for step in range(max_iterations):
+            eta = intercept + X @ beta
+            p = expit(eta)
+            w = np.maximum(p * (1 - p), 1e-5)
+            #Residual of the working response z = eta + (y - p) / w, weighted by w
+            residual = y - p
+            variance = (w @ (X * X)) / n
+            previous = np.r_[intercept, beta]
+            full = True
+            while True:
+                largest = 0
+                for j in (range(k) if full else np.flatnonzero(beta)):
+                    old = beta[j]
+                    beta[j] = _soft_threshold(X[:, j] @ residual / n + variance[j] * old, penalty * alpha) / (variance[j] + penalty * (1 - alpha))
+                    if beta[j] != old:
+                        residual -= w * X[:, j] * (beta[j] - old)
+                        largest = max(largest, variance[j] * (beta[j] - old) ** 2)
+                shift = residual.sum() / w.sum()
+                intercept += shift
+                residual -= w * shift
+                largest = max(largest, w.mean() * shift ** 2)
+                if largest < tolerance:
+                    if full:
+                        break
+                    full = True
+                else:
+                    full = False
+            steps[position] = step + 1
+            if np.abs(np.r_[intercept, beta] - previous).max() < np.sqrt(tolerance):
+                break
+        path[position] = np.r_[intercept, beta]
+    return path, steps
+
+
+def _lambda_grid(y, X, alpha, n_lambdas, lambda_ratio):
+    """Log-spaced lambdas from the smallest one keeping every coefficient at 0 down to lambda_ratio times it."""
+    largest = np.abs(X.T @ (y - y.mean())).max() / (len(y) * max(alpha, 1e-3))
+    return np.geomspace(largest, largest * lambda_ratio, n_lambdas)
+
+
+def _standardize(X):
+    """Column means and standard deviations of X and X centred and scaled by them, constant columns are left unscaled."""
+    center = X.mean(axis=0)
+    scale = X.std(axis=0)
+    scale = np.where(scale > 0, scale, 1)
+    return center, scale, (X - center) / scale
+
+
+def _unstandardize(path, center, scale):
+    """Coefficients of the standardized variables mapped back to the units of X, intercept first."""
+    beta = path[:, 1:] / scale
+    return np.column_stack([path[:, 0] - beta @ center, beta])
+
+
+def elastic_net_path(y, X, alpha=1.0, n_lambdas=100, lambda_ratio=1e-3, lambdas=None, max_iterations=100, tolerance=1e-7):
+    """
+    Elastic-net penalized logistic regression path of y on all columns of X, on the patients with every column observed,
+    minimizing -log-likelihood / n + lambda (alpha |b|_1 + (1 - alpha) |b|_2^2 / 2) over the standardized variables with an
+    unpenalized intercept. alpha=1 is the lasso and alpha=0 ridge. Coordinate descent with warm starts along the
+    decreasing lambda grid makes the whole path cost about as much as a few single fits.
+    Returns one row per lambda with 'Lambda', 'Variables' (non-zero coefficients), 'Deviance', 'IRLS Steps' and the
+    coefficients in the units of X.
+    """
+    y, X = _complete_cases(y, X)
+    center, scale, values = _standardize(X.to_numpy(dtype=np.float64))
+    lambdas = _lambda_grid(y, values, alpha, n_lambdas, lambda_ratio) if lambdas is None else np.sort(np.asarray(lambdas, dtype=np.float64))[::-1]
+    path, steps = _elastic_net(y, values, lambdas, alpha, max_iterations, tolerance)
+    coefficients = _unstandardize(path, center, scale)
+    deviance = [-2 * _log_likelihood(y, coefficients[position, 0] + X.to_numpy(dtype=np.float64) @ coefficients[position, 1:]) for position in range(len(lambdas))]
+    Path = pd.DataFrame(coefficients, columns=['Intercept'] + list(X.columns))
+    Path.insert(0, 'Lambda', lambdas)
+    Path.insert(1, 'Variables', (path[:, 1:] != 0).sum(axis=1))
+    Path.insert(2, 'Deviance', deviance)
+    Path.insert(3, 'IRLS Steps', steps)
+    return Path
+
+
+def _elastic_net_fold(task):
+    """Held-out deviance and AUC of every lambda of the path fitted on one training fold."""
+    y, X, train, test, lambdas, alpha, max_iterations, tolerance = task
+    center, scale, values = _standardize(X[train])
+    coefficients = _unstandardize(_elastic_net(y[train], values, lambdas, alpha, max_iterations, tolerance)[0], center, scale)
+    eta = coefficients[:, :1] + coefficients[:, 1:] @ X[test].T
+    deviance = np.array([-2 * _log_likelihood(y[test], row) / len(test) for row in eta])
+    auc = np.array([roc_auc_score(y[test], row) if np.ptp(row) > 0 else 0.5 for row in eta])
+    return deviance, auc
+
+
+def elastic_net_cv(y, X, alpha=1.0, folds=10, seed=1, n_lambdas=100, lambda_ratio=1e-3, workers=None, max_iterations=100, tolerance=1e-7):
+    """
+    Cross-validated lambda of elastic_net_path: the path is refitted on every stratified training fold with the lambda grid
+    of the full data, the folds running over a process pool, and scored by the held-out deviance per patient.
+    Returns (the full-data path with 'CV Deviance', 'CV Std Error' and 'CV AUC' columns, Series of the lambda with the
+    lowest CV deviance 'Lambda Min' and of the largest lambda within one standard error of it 'Lambda 1SE').
+    """
+    y, X = _complete_cases(y, X)
+    Path = elastic_net_path(y, X, alpha, n_lambdas, lambda_ratio, None, max_iterations, tolerance)
+    lambdas = Path['Lambda'].to_numpy()
+    values = X.to_numpy(dtype=np.float64)
+    splits = list(RepeatedStratifiedKFold(n_splits=folds, n_repeats=1, random_state=seed).split(values, y))
+    tasks = [(y, values, train, test, lambdas, alpha, max_iterations, tolerance) for train, test in splits]
+    with _pool(workers) as mapper:
+        deviance, auc = map(np.array, zip(*mapper(_elastic_net_fold, tasks)))
+    Path['CV Deviance'] = deviance.mean(axis=0)
+    Path['CV Std Error'] = deviance.std(axis=0, ddof=1) / np.sqrt(folds)
+    Path['CV AUC'] = auc.mean(axis=0)
+    best = int(Path['CV Deviance'].idxmin())
+    within = Path.index[Path['CV Deviance'] <= Path.loc[best, 'CV Deviance'] + Path.loc[best, 'CV Std Error']]
+    return Path, pd.Series({'Lambda Min': lambdas[best], 'Lambda 1SE': lambdas[within.min()]})
+
+
+def _accumulate(chunks, outcome, columns, coefficients):
+    """
+    One pass over the frames of chunks() summing the log-likelihood, the number of complete rows, X'WX and X'Wz at
+    coefficients, z = eta + (y - p) / w being the IRLS working response. Only p x p sums are kept between chunks.
+    """
+    information = np.zeros((len(coefficients), len(coefficients)))
+    weighted = np.zeros(len(coefficients))
+    likelihood = 0.0
+    count = 0
+    for Chunk in chunks():
+        Chunk = Chunk[[outcome] + list(columns)].apply(pd.to_numeric, errors='coerce').dropna()
+        y = Chunk[outcome].to_numpy(dtype=np.float64)
+        design = np.column_stack([np.ones(len(y)), Chunk[list(columns)].to_numpy(dtype=np.float64)])
+        eta = design @ coefficients
+        p = expit(eta)
+        w = p * (1 - p)
+        information += design.T @ (design * w[:, None])
+        weighted += design.T @ (w * eta + y - p)
+        likelihood += _log_likelihood(y, eta)
+        count += len(y)
+    return likelihood, count, information, weighted
+
+
+def streaming_logit(chunks, outcome, columns, max_iterations=35, tolerance=1e-8):
+    """
+    Out-of-core logistic regression of outcome on columns, for cohorts that do not fit in memory. chunks is a function
+    returning a fresh iterable of frames on every call (e.g. lambda: iter_scored(path, columns, chunksize)), read once per
+    pass; rows with a missing value are left out. Every pass accumulates X'WX and X'Wz and the p x p system is solved for
+    the next coefficients, so memory is O(p^2) plus one chunk. Steps are halved, one extra pass each, while they lower
+    the log-likelihood, and convergence is judged on the full Newton step, as in irls. The covariance, log-likelihood and
+    score reported are always those of the pass at the returned coefficients.
+    Returns (table and Series of diagnostics in the format of logit_model).
+    """
+    coefficients = np.zeros(len(columns) + 1)
+    likelihood, count, information, weighted = _accumulate(chunks, outcome, columns, coefficients)
+    newton = np.zeros(len(coefficients))
+    converged = False
+    halvings = 0
+    iteration = 0
+    while iteration < max_iterations:
+        iteration += 1
+        newton = np.linalg.solve(information, weighted) - coefficients
+        converged = np.abs(newton).max() < tolerance
+        step = newton
+        for halving in range(30):
+            accumulated = _accumulate(chunks, outcome, columns, coefficients + step)
+            if accumulated[0] >= likelihood - 1e-10:
+                break
+            step = step / 2
+            halvings += 1
+        else:
+            #No damped step keeps the log-likelihood: stay at the current coefficients and their sums
+            break
+        coefficients = coefficients + step
+        likelihood, count, information, weighted = accumulated
+        if converged:
+            break
+    covariance = np.linalg.inv(information)
+    error = np.sqrt(np.diag(covariance))
+    z = coefficients / error
+    margin = norm.ppf(0.975) * error
+    Table = pd.DataFrame({'Coefficient': coefficients, 'Std Error': error, 'z': z, 'P-value': 2 * norm.sf(np.abs(z)), 'Odds Ratio': np.exp(coefficients),
+                          '2.5%': np.exp(coefficients - margin), '97.5%': np.exp(coefficients + margin)}, index=['Intercept'] + list(columns))
+    return Table, pd.Series({'Log-Likelihood': likelihood, 'AIC': 2 * len(coefficients) - 2 * likelihood, 'N': count, 'Converged': converged,
+                             'Iterations': iteration, 'Halvings': halvings, 'Max Score': np.abs(weighted - information @ coefficients).max(),
+                             'Max Step': np.abs(newton).max()})
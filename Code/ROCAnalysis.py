@@ -0,0 +1,218 @@
+"""
+Created on October 18th, 2026
+KyeongsangUniversity Bacteremia ROC analysis engine
+Batched bootstrap of the AUC and the Youden-point sensitivity and specificity used by BacteremiaTester.py
+"""
+
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from scipy.stats import norm, rankdata
+
+#Number of resamples evaluated together, bounds the (batch x patients) work arrays
+#Every batch of every marker draws from its own stream spawned from the seed, so the results do not depend on the number of
+#workers or on the order of the markers, but changing BatchSize changes the resamples
+BatchSize = 500
+
+#Batches drawn per marker between two convergence checks of the adaptive mode
+RoundBatches = 2
+
+
+def roc_counts(positive, negative, levels=None):
+    """
+    ROC statistics of every row of the (resamples x score groups) arrays positive and negative, the weighted number of
+    positive and negative patients at each distinct score ordered from the highest score down.
+    Returns (AUC, sensitivity, specificity) arrays with one value per row, and the cut-off when levels gives a value per
+    score group (NaN for rows whose best point is the origin). The AUC is the weighted Mann-Whitney statistic
+    with ties counted as one half, sensitivity and specificity are taken at the first threshold maximizing the Youden index
+    tpr - fpr, starting from the (0, 0) point like sklearn's roc_curve.
+    """
+    tps = np.cumsum(positive, axis=1, dtype=np.float64)
+    fps = np.cumsum(negative, axis=1, dtype=np.float64)
+    positives = tps[:, -1:]
+    negatives = fps[:, -1:]
+    auc = (negative * (2 * (tps - positive) + positive)).sum(axis=1) / (2 * positives[:, 0] * negatives[:, 0])
+
+    #Score groups that were not drawn repeat the previous point of the curve and never come first in the argmax
+    youden = tps / positives - fps / negatives
+    best = np.argmax(youden, axis=1)
+    rows = np.arange(len(youden))
+    origin = youden[rows, best] <= 0
+    sensitivity = np.where(origin, 0, tps[rows, best] / positives[:, 0])
+    specificity = np.where(origin, 1, 1 - fps[rows, best] / negatives[:, 0])
+    if levels is not None:
+        return auc, sensitivity, specificity, np.where(origin, np.nan, levels[best])
+    return auc, sensitivity, specificity
+
+
+def _bootstrap_batch(task):
+    """
+    ROC statistics of one batch of resamples, drawn from the stream keyed by the marker and the batch number.
+    Each resample is a vector of counts per patient, summed over the score groups of the ranking made once per marker.
+    """
+    y, order, starts, levels, key, seed, batch, size, resampling = task
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(key, batch)))
+    if resampling == 'poisson':
+        counts = rng.poisson(1, (size, len(y)))
+    else:
+        #Multinomial counts of n draws with replacement, the same resamples as indexing with the drawn patients
+        indices = rng.integers(0, len(y), (size, len(y)))
+        counts = np.bincount((np.arange(size)[:, None] * len(y) + indices).ravel(), minlength=size * len(y)).reshape(size, len(y))
+    counts = counts[:, order]
+    positive = np.add.reduceat(counts * y[order], starts, axis=1)
+    negative = np.add.reduceat(counts * (1 - y[order]), starts, axis=1)
+    valid = positive.any(axis=1) & negative.any(axis=1)
+    return np.column_stack(roc_counts(positive[valid], negative[valid], levels))
+
+
+def percentile_error(values, q):
+    """
+    Monte Carlo standard error of the q quantile of the bootstrapped values, half the distance between the order statistics
+    one binomial standard deviation (sqrt(B q (1 - q)) positions) below and above it.
+    """
+    values = np.sort(values)
+    spread = np.sqrt(len(values) * q * (1 - q))
+    lower = max(int(np.floor(len(values) * q - spread)), 0)
+    upper = min(int(np.ceil(len(values) * q + spread)), len(values) - 1)
+    return (values[upper] - values[lower]) / 2
+
+
+def _converged(results, tolerance):
+    """Whether both CI bounds of the AUC, sensitivity and specificity are stable to tolerance, the cut-off is in raw units and not checked."""
+    return all(percentile_error(results[:, column], q) < tolerance for column in range(3) for q in (0.025, 0.975))
+
+
+def bootstrap_roc(y, Predictions, n_bootstraps=10000, seed=1, workers=None, resampling='multinomial', tolerance=None, Levels=None):
+    """
+    Bootstrap the AUC, sensitivity and specificity of every column of Predictions (patients x markers) against the 0/1
+    outcome y, resamples holding a single class are skipped. resampling='poisson' draws Poisson(1) counts per patient
+    instead of the multinomial counts of the ordinary bootstrap. The batches are spread over a pool of workers processes
+    (None uses all cores, 1 runs in this process) and the results are identical for any number of workers.
+    With a tolerance the resamples of every marker are drawn RoundBatches batches at a time and a marker stops once the
+    Monte Carlo error of its 2.5% and 97.5% percentiles is below the tolerance, n_bootstraps is then the maximum.
+    Levels (patients x markers, e.g. the raw biomarker behind a univariate prediction, which ranks the patients the same way)
+    adds the value of Levels at the Youden point of every resample as a 'Cut-off' column, computed in the same pass.
+    Returns {marker: DataFrame with 'AUC', 'Sensitivity', 'Specificity' (and 'Cut-off') columns}.
+    """
+    y = np.asarray(y, dtype=np.int64)
+    Predictions = pd.DataFrame(Predictions)
+    Rankings = {}
+    for marker in Predictions.columns:
+        #Rank once per marker: patients ordered from the highest score down and the first position of every distinct score
+        scores = -Predictions[marker].to_numpy(dtype=np.float64)
+        order = np.argsort(scores, kind='mergesort')
+        starts = np.flatnonzero(np.r_[True, scores[order][1:] != scores[order][:-1]])
+        levels = None if Levels is None else pd.DataFrame(Levels)[marker].to_numpy(dtype=np.float64)[order][starts]
+        Rankings[marker] = (order, starts, levels, zlib.crc32(str(marker).encode()))
+    sizes = [min(BatchSize, n_bootstraps - start) for start in range(0, n_bootstraps, BatchSize)]
+    step = len(sizes) if tolerance is None else RoundBatches
+
+    Results = {marker: [] for marker in Predictions.columns}
+    active = list(Predictions.columns)
+    executor = ProcessPoolExecutor(workers) if workers != 1 else None
+    try:
+        while active:
+            markers = [marker for marker in active for batch in range(len(Results[marker]), min(len(Results[marker]) + step, len(sizes)))]
+            tasks = [(y, *Rankings[marker], seed, batch, sizes[batch], resampling)
+                     for marker in active for batch in range(len(Results[marker]), min(len(Results[marker]) + step, len(sizes)))]
+            for marker, result in zip(markers, executor.map(_bootstrap_batch, tasks) if executor else map(_bootstrap_batch, tasks)):
+                Results[marker].append(result)
+            active = [marker for marker in active if len(Results[marker]) < len(sizes) and not (tolerance is not None and _converged(np.concatenate(Results[marker]), tolerance))]
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    columns = ['AUC', 'Sensitivity', 'Specificity'] + (['Cut-off'] if Levels is not None else [])
+    return {marker: pd.DataFrame(np.concatenate(Results[marker]), columns=columns) for marker in Results}
+
+
+def delong_test(y, Predictions):
+    """
+    Fast DeLong comparison of the AUCs of every column of Predictions (patients x markers) against the 0/1 outcome y,
+    with the midrank algorithm of Sun and Xu: one ranking of the positives, the negatives and all patients per marker.
+    Returns (AUC Series, AUC covariance DataFrame, DataFrame of the two-sided p-values of every pairwise AUC difference).
+    """
+    Predictions = pd.DataFrame(Predictions)
+    y = np.asarray(y).astype(bool)
+    values = Predictions.to_numpy(dtype=np.float64)
+    positive = values[y]
+    negative = values[~y]
+    m = len(positive)
+    n = len(negative)
+    overall = rankdata(values, axis=0)
+    positiveRanks = rankdata(positive, axis=0)
+    negativeRanks = rankdata(negative, axis=0)
+
+    #Structural components: the share of negatives below each positive and of positives above each negative
+    v10 = (overall[y] - positiveRanks) / n
+    v01 = 1 - (overall[~y] - negativeRanks) / m
+    auc = v10.mean(axis=0)
+    covariance = np.atleast_2d(np.cov(v10, rowvar=False)) / m + np.atleast_2d(np.cov(v01, rowvar=False)) / n
+    variance = np.diag(covariance)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        z = (auc[:, None] - auc[None, :]) / np.sqrt(variance[:, None] + variance[None, :] - 2 * covariance)
+    pvalues = np.where(np.eye(len(auc), dtype=bool), 1, 2 * norm.sf(np.abs(z)))
+    return (pd.Series(auc, index=Predictions.columns), pd.DataFrame(covariance, index=Predictions.columns, columns=Predictions.columns),
+            pd.DataFrame(pvalues, index=Predictions.columns, columns=Predictions.columns))
+
+
+def threshold_sweep(y, Predictions, prevalence=None):
+    """
+    Diagnostic metrics of every column of Predictions (patients x markers) at every distinct threshold, a patient being
+    called positive when its score is at or above the threshold. One sort and cumulative sums per marker give the
+    confusion counts, sensitivity, specificity, PPV, NPV, LR+, LR-, DOR and Youden index of every threshold.
+    PPV and NPV use the given prevalence, the prevalence of y by default.
+    Returns a long table with one row per marker and threshold, thresholds in descending order within each marker.
+    """
+    Predictions = pd.DataFrame(Predictions)
+    y = np.asarray(y, dtype=np.int64)
+    positives = y.sum()
+    negatives = len(y) - positives
+    prevalence = positives / len(y) if prevalence is None else prevalence
+    Sweeps = []
+    for marker in Predictions.columns:
+        scores = Predictions[marker].to_numpy(dtype=np.float64)
+        order = np.argsort(-scores, kind='mergesort')
+        scores = scores[order]
+        end = np.r_[scores[1:] != scores[:-1], True]
+        tp = np.cumsum(y[order])[end]
+        fp = np.cumsum(1 - y[order])[end]
+        Sweeps.append(pd.DataFrame({'Marker': marker, 'Threshold': scores[end], 'TP': tp, 'FP': fp, 'FN': positives - tp, 'TN': negatives - fp}))
+    Sweep = pd.concat(Sweeps, ignore_index=True)
+    sensitivity = Sweep['TP'] / positives
+    specificity = Sweep['TN'] / negatives
+    with np.errstate(divide='ignore', invalid='ignore'):
+        Sweep['Sensitivity'] = sensitivity
+        Sweep['Specificity'] = specificity
+        Sweep['PPV'] = sensitivity * prevalence / (sensitivity * prevalence + (1 - specificity) * (1 - prevalence))
+        Sweep['NPV'] = specificity * (1 - prevalence) / ((1 - sensitivity) * prevalence + specificity * (1 - prevalence))
+        Sweep['LR+'] = sensitivity / (1 - specificity)
+        Sweep['LR-'] = (1 - sensitivity) / specificity
+        Sweep['DOR'] = Sweep['LR+'] / Sweep['LR-']
+    Sweep['Youden'] = sensitivity + specificity - 1
+    return Sweep
+
+
+def operating_points(Sweep, minimum=None, metric='Sensitivity', target='Specificity'):
+    """
+    One row of threshold_sweep per marker, indexed by marker: the first threshold maximizing the Youden index, or with a
+    minimum the threshold with the highest target among those where metric reaches the minimum (e.g. sensitivity >= 0.9).
+    """
+    if minimum is None:
+        return Sweep.loc[Sweep.groupby('Marker', sort=False)['Youden'].idxmax()].set_index('Marker')
+    Eligible = Sweep[Sweep[metric] >= minimum]
+    return Eligible.loc[Eligible.groupby('Marker', sort=False)[target].idxmax()].set_index('Marker')
+
+
+def interval_string(values, digits, scale=1, unit=''):
+    """Median [2.5th - 97.5th percentile] of the bootstrapped values in the format of the result tables."""
+    values = np.sort(np.asarray(values))
+    return (str(round(np.median(values) * scale, digits)) + unit + ' [' + str(round(values[int(0.025 * len(values))] * scale, digits)) + '-'
+            + str(round(values[int(0.975 * len(values))] * scale, digits)) + ']')
+
+
+def bootstrap_strings(Bootstrap, marker, unit='%'):
+    """AUC, sensitivity and specificity interval strings of one marker of bootstrap_roc."""
+    Result = Bootstrap[marker]
+    return (interval_string(Result['AUC'], 3), interval_string(Result['Sensitivity'], 1, 100, unit),
+            interval_string(Result['Specificity'], 1, 100, unit))
@@ -0,0 +1,236 @@
+"""
+Created on October 18th, 2026
+KyeongsangUniversity Sepsis Severity score pipeline
+Reading, scoring and writing the ClinicalData files used by ScoreCalculator.py
+"""
+
+import os
+import glob
+import hashlib
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+from SeverityScores import compute_scores, compile_tables, ScoreTables
+
+
+def add_scores(Data, Scores):
+    """
+    Append the total of each named score to Data.
+    Returns (Data, Subscores, Missing) where Subscores and Missing are the frames returned by compute_scores.
+    """
+    Subscores, Missing = compute_scores(Data, Scores)
+    for score in Scores:
+        total = ScoreTables[score]['score']
+        Data[total] = Subscores[total]
+    return Data, Subscores, Missing
+
+
+@contextmanager
+def scored_writer(outputPath, encoding='cp949'):
+    """
+    Open outputPath for writing scored frames and yield a function that appends one frame to it.
+    Paths ending in .parquet are written as typed columnar row groups without the row index (pyarrow is only needed then),
+    anything else as CSV text in the given encoding with the row index as the first column, as ScoreCalculator.py always wrote it.
+    """
+    if str(outputPath).endswith('.parquet'):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        state = {}
+
+        def append(Data):
+            Table = pa.Table.from_pandas(Data, schema=state.get('schema'), preserve_index=False)
+            if 'writer' not in state:
+                #Columns that are empty in the first frame would otherwise be typed as null for the whole file
+                state['schema'] = pa.schema([field.with_type(pa.string()) if pa.types.is_null(field.type) else field for field in Table.schema],
+                                            metadata=Table.schema.metadata)
+                state['writer'] = pq.ParquetWriter(outputPath, state['schema'])
+                Table = Table.cast(state['schema'])
+            state['writer'].write_table(Table)
+        try:
+            yield append
+        finally:
+            if 'writer' in state:
+                state['writer'].close()
+    else:
+        with open(outputPath, 'w', encoding=encoding, newline='') as output:
+            state = {'header': True}
+
+            def append(Data):
+                Data.to_csv(output, header=state['header'])
+                state['header'] = False
+            yield append
+
+
+def write_scored(Data, outputPath, encoding='cp949'):
+    """Write a scored frame to a .parquet file or to a CSV file in the given encoding."""
+    with scored_writer(outputPath, encoding) as append:
+        append(Data)
+
+
+def read_scored(path, columns=None, encoding='cp949'):
+    """
+    Read a file written by ScoreCalculator.py, dropping the CSV row index column.
+    When columns is given only the listed columns present in the file are read, for .parquet files the other columns are never decoded.
+    """
+    if str(path).endswith('.parquet'):
+        if columns is not None:
+            import pyarrow.parquet as pq
+            columns = [column for column in pq.read_schema(path).names if column in columns]
+        return pd.read_parquet(path, columns=columns)
+    Data = pd.read_csv(path, encoding=encoding, usecols=(lambda column: column in columns) if columns is not None else None)
+    return Data.drop(columns=['Unnamed: 0'], errors='ignore')
+
+
+def iter_scored(path, columns=None, chunksize=100000, encoding='cp949'):
+    """
+    Read a file written by ScoreCalculator.py in chunks of about chunksize rows, yielding one frame per chunk as read_scored
+    would return it. .parquet files are read batch by batch with pyarrow, CSV files with pandas' chunked reader.
+    """
+    if str(path).endswith('.parquet'):
+        import pyarrow.parquet as pq
+        File = pq.ParquetFile(path)
+        if columns is not None:
+            columns = [column for column in File.schema_arrow.names if column in columns]
+        for batch in File.iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+        return
+    for Data in pd.read_csv(path, encoding=encoding, chunksize=chunksize, usecols=(lambda column: column in columns) if columns is not None else None):
+        yield Data.drop(columns=['Unnamed: 0'], errors='ignore')
+
+
+def _dtype_kinds(Frames):
+    """Set of the dtype kinds inferred for every column over the frames."""
+    kinds = {}
+    for Chunk in Frames:
+        for column, dtype in Chunk.dtypes.items():
+            kinds.setdefault(column, set()).add(dtype.kind)
+    return kinds
+
+
+def _settle_dtypes(kinds):
+    """
+    The dtypes of the columns whose inferred dtype kinds differ: integer columns with missing values in some chunks are
+    promoted to float, and columns mixing numbers, booleans and text are read as text.
+    """
+    dtypes = {}
+    for column, kind in kinds.items():
+        if len(kind) > 1:
+            dtypes[column] = 'float64' if kind <= {'i', 'u', 'f'} else object
+    return dtypes
+
+
+def scan_dtypes(inputPath, chunksize, **readOptions):
+    """
+    Read inputPath chunk by chunk and return the dtypes the columns would get if the file were read in one go.
+    Only columns whose inferred dtype differs between chunks are returned, see _settle_dtypes.
+    """
+    return _settle_dtypes(_dtype_kinds(pd.read_csv(inputPath, chunksize=chunksize, **readOptions)))
+
+
+def stream_scores(inputPath, outputPath, Scores, chunksize, encoding='cp949', **readOptions):
+    """
+    Score inputPath in chunks of chunksize rows and append each scored chunk to outputPath.
+    Peak memory is bounded by the chunk size and the file written is identical to scoring the whole file at once
+    (byte-identical for CSV output).
+    Returns the number of rows written.
+    """
+    dtypes = scan_dtypes(inputPath, chunksize, **readOptions)
+    rows = 0
+    with scored_writer(outputPath, encoding) as append:
+        for Chunk in pd.read_csv(inputPath, chunksize=chunksize, dtype=dtypes, **readOptions):
+            append(add_scores(Chunk, Scores)[0])
+            rows += len(Chunk)
+    return rows
+
+
+def partition_paths(source):
+    """Return the partition files of a directory (every .csv inside it) or of a glob pattern, in sorted order."""
+    pattern = os.path.join(source, '*.csv') if os.path.isdir(source) else source
+    paths = sorted(glob.glob(pattern))
+    if not paths:
+        raise FileNotFoundError('No partition files match ' + str(source))
+    return paths
+
+
+def _partition_kinds(task):
+    """Worker for parallel_scores: dtype kinds of the columns of one partition file."""
+    path, readOptions = task
+    return _dtype_kinds([pd.read_csv(path, **readOptions)])
+
+
+def _score_partition(task):
+    """Worker for parallel_scores: read and score one partition file with the dtypes settled over all partitions."""
+    path, Scores, dtypes, readOptions = task
+    return add_scores(pd.read_csv(path, dtype=dtypes, **readOptions), Scores)[0]
+
+
+def parallel_scores(source, outputPath, Scores, workers=None, encoding='cp949', **readOptions):
+    """
+    Score every partition of source (a directory or glob pattern) in a pool of worker processes.
+    Partitions are merged into outputPath in sorted file name order with a continuous row index, so the output does
+    not depend on the number of workers. A first pass settles the dtypes over all partitions, as scan_dtypes does for the
+    chunks of one file, so a column read as integers in one partition and as floats in another is written as float.
+    Returns (partition paths, number of rows written).
+    """
+    paths = partition_paths(source)
+    columns = None
+    rows = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        kinds = {}
+        for partitionKinds in executor.map(_partition_kinds, [(path, readOptions) for path in paths]):
+            for column, kind in partitionKinds.items():
+                kinds.setdefault(column, set()).update(kind)
+        dtypes = _settle_dtypes(kinds)
+        with scored_writer(outputPath, encoding) as append:
+            for path, Data in zip(paths, executor.map(_score_partition, [(path, Scores, dtypes, readOptions) for path in paths])):
+                if columns is None:
+                    columns = list(Data.columns)
+                elif list(Data.columns) != columns:
+                    raise ValueError('Partition ' + path + ' does not have the same columns as ' + paths[0])
+                Data.index = pd.RangeIndex(rows, rows + len(Data))
+                append(Data)
+                rows += len(Data)
+    return paths, rows
+
+
+def row_hashes(Data, Scores):
+    """
+    Hash the input columns read by the named score tables, one 64-bit value per row of Data.
+    The table definitions are part of the hash key, so editing a table invalidates every cached row.
+    """
+    columns = []
+    for column, kind in compile_tables([ScoreTables[score] for score in Scores])[1]:
+        if column not in columns:
+            columns.append(column)
+    signature = hashlib.md5(repr([ScoreTables[score] for score in Scores]).encode()).hexdigest()[:16]
+    return pd.util.hash_pandas_object(Data[columns], index=False, hash_key=signature).to_numpy().view('int64')
+
+
+def _load_cache(cachePath, Data, totals):
+    """Read the sidecar score cache, an empty cache is returned if the file is missing or was written for other scores."""
+    columns = ['Serial Number', 'Input Hash'] + totals
+    if os.path.exists(cachePath):
+        Cache = pd.read_csv(cachePath, dtype={'Serial Number': Data['Serial Number'].dtype, 'Input Hash': 'int64'})
+        if list(Cache.columns) == columns:
+            return Cache.drop_duplicates(['Serial Number', 'Input Hash'])
+    return pd.DataFrame({'Serial Number': pd.Series(dtype=Data['Serial Number'].dtype), 'Input Hash': pd.Series(dtype='int64'),
+                         **{total: pd.Series(dtype='int64') for total in totals}})
+
+
+def incremental_scores(Data, cachePath, Scores):
+    """
+    Score Data reusing the results stored in the sidecar file cachePath for rows whose inputs have not changed.
+    Rows are matched on 'Serial Number' and the hash of their score inputs, only new or changed rows are recomputed.
+    The sidecar is rewritten with the current rows. Returns (Data with the score totals appended, number of rows recomputed).
+    """
+    totals = [ScoreTables[score]['score'] for score in Scores]
+    Keys = pd.DataFrame({'Serial Number': Data['Serial Number'].to_numpy(), 'Input Hash': row_hashes(Data, Scores)})
+    Results = Keys.merge(_load_cache(cachePath, Data, totals), on=['Serial Number', 'Input Hash'], how='left')
+    stale = Results[totals].isna().any(axis=1).to_numpy()
+    if stale.any():
+        Results.loc[stale, totals] = compute_scores(Data[stale], Scores)[0][totals].to_numpy()
+    for total in totals:
+        Data[total] = Results[total].to_numpy(dtype='int64')
+    Results = Results.astype({total: 'int64' for total in totals})
+    Results.to_csv(cachePath, index=False)
+    return Data, int(stale.sum())
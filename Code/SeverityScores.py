@@ -0,0 +1,397 @@
+"""
+Created on October 18th, 2026
+KyeongsangUniversity Sepsis Severity score engine
+Declarative threshold tables for the severity scores used by ScoreCalculator.py and the compiler that evaluates them
+"""
+
+import numpy as np
+import pandas as pd
+
+#Each score table maps a subscore name to a rule, rules are plain dicts:
+#'bins'     : {'column', 'cuts', 'points', 'closed', 'missing'} one sorted-bin lookup, points has one entry per range
+#             closed='left' gives [lower, upper) ranges, closed='right' gives (lower, upper] ranges like pd.cut
+#             rows with a missing value get 'missing' points (default 0) and are flagged in the missing mask
+#'cases'    : ordered [(conditions, points)] pairs, the first matching case wins, unmatched rows get 'default'
+#'require'  : conditions that must hold for a 'bins' rule to apply, otherwise 'otherwise' points are awarded
+#'multiply' : (conditions, factor) applied to the points of a 'bins' rule
+#'switch'   : (conditions, rule when true, rule when false)
+#'max'      : list of rules, the highest of their points is awarded
+#Conditions are lists of (column, operator, value) tuples that must all hold
+
+SOFATable = {
+    'score': 'SOFA score',
+    'rules': {
+        'Respiratory SOFA Subscore': {'bins': {'column': 'PaO2/FiO2', 'cuts': [99, 199, 299, 399], 'points': [4, 3, 2, 1, 0], 'closed': 'right'}},
+        'CNS SOFA Subscore': {'bins': {'column': 'GCS Score', 'cuts': [5.9, 9.9, 12.9, 14.9], 'points': [4, 3, 2, 1, 0], 'closed': 'right'}},
+        'Cardio SOFA Subscore': {'cases': [([('Dosage Type', '==', 'None'), ('MAP', '>', 70)], 0),
+                                           ([('Dosage Type', '==', 'None')], 1),
+                                           ([('Dosage Type', '==', 'Dopamine'), ('Total Dosage', '<=', 5)], 2),
+                                           ([('Dosage Type', '==', 'Dobutamine'), ('Total Dosage', '<=', 5)], 2),
+                                           ([('Dosage Type', '==', 'Dobutamine'), ('Total Dosage', '>', 5)], 3),
+                                           ([('Dosage Type', '==', 'Norpin'), ('Total Dosage', '<=', 0.1)], 3),
+                                           ([('Dosage Type', '==', 'Epinephrine'), ('Total Dosage', '<=', 0.1)], 3)],
+                                 'default': 4},
+        'Liver SOFA Subscore': {'bins': {'column': 'Bilirubin', 'cuts': [1.19, 1.99, 5.99, 11.99], 'points': [0, 1, 2, 3, 4], 'closed': 'right'}},
+        'Coagulation SOFA Subscore': {'bins': {'column': 'Platelets', 'cuts': [20, 50, 100, 150], 'points': [4, 3, 2, 1, 0], 'missing': 4},
+                                      'require': [('Platelet Concentration Transfusion Status', '==', 'N')], 'otherwise': 4},
+        'Kidney SOFA Subscore': {'bins': {'column': 'Creatinine', 'cuts': [1.2, 2, 3.5, 5], 'points': [0, 1, 2, 3, 4], 'missing': 4},
+                                 'require': [('Hemodialysis Status', '==', 'N')], 'otherwise': 4},
+    }
+}
+
+#APACHE II Score = acute physiology score + age score + chronic health status score
+APACHETable = {
+    'score': 'APACHE II score',
+    'rules': {
+        'Temp Subscore': {'bins': {'column': 'Body Temperature', 'cuts': [30, 32, 34, 36, 38.5, 39, 41], 'points': [4, 3, 2, 1, 0, 1, 3, 4]}},
+        'MAP Subscore': {'bins': {'column': 'MAP', 'cuts': [50, 70, 110, 130, 160], 'points': [4, 2, 0, 2, 3, 4]}},
+        'HR Subscore': {'bins': {'column': 'Heart Rate', 'cuts': [40, 55, 70, 110, 140, 180], 'points': [4, 3, 2, 0, 2, 3, 4]}},
+        'RR Subscore': {'bins': {'column': 'Respiratory Rate', 'cuts': [6, 10, 12, 25, 35, 50], 'points': [4, 2, 1, 0, 1, 3, 4]}},
+        #FiO2 >= 0.5 is scored on A-aDO2, anything else on PaO2 where 61-70 is closed on both ends
+        'Oxygenation Subscore': {'switch': ([('FiO2', '>=', 0.5)],
+                                            {'bins': {'column': 'A-aDO2', 'cuts': [200, 350, 500], 'points': [0, 2, 3, 4]}},
+                                            {'bins': {'column': 'PaO2', 'cuts': [55, 61, 70], 'points': [4, 3, 1, 0], 'closed': ['left', 'left', 'right']}})},
+        'PH Subscore': {'bins': {'column': 'Arterial pH', 'cuts': [7.15, 7.25, 7.33, 7.5, 7.6, 7.7], 'points': [4, 3, 2, 0, 1, 3, 4]}},
+        'NA Subscore': {'bins': {'column': 'Na', 'cuts': [111, 120, 130, 150, 155, 160, 180], 'points': [4, 3, 2, 0, 1, 2, 3, 4]}},
+        'K Subscore': {'bins': {'column': 'K', 'cuts': [2.5, 3, 3.5, 5.5, 6, 7], 'points': [4, 2, 1, 0, 1, 3, 4]}},
+        #Double points for acute renal failure
+        'Creatinine Subscore': {'bins': {'column': 'Creatinine', 'cuts': [0.6, 1.5, 2, 3.5], 'points': [2, 0, 2, 3, 4]},
+                                'multiply': ([('AKI Status', '==', 'Y')], 2)},
+        'Hct Subscore': {'bins': {'column': 'Hematocrite', 'cuts': [20, 30, 46, 50, 60], 'points': [4, 2, 0, 1, 2, 4]}},
+        'WBC Subscore': {'bins': {'column': 'WBC', 'cuts': [1, 3, 15, 20, 40], 'points': [4, 2, 0, 1, 2, 4]}},
+        #15 - GCS
+        'GCS Subscore': {'bins': {'column': 'GCS Score', 'cuts': list(range(4, 16)), 'points': list(range(12, -1, -1))}},
+        'Age Subscore': {'bins': {'column': 'Age', 'cuts': [44, 55, 65, 75], 'points': [0, 2, 3, 5, 6]}},
+        #Elective postoperative patient with immunocompromise or history of severe organ failure: +2
+        #Nonoperative patient or emergency postperative patient with immunocompromise or severe organ inssuficiency: +5
+        'ChronicHealth Subscore': {'cases': [([('Elective Postoperative Patients', '==', 'Y'), ('Immunocompromised State', '==', 'Y')], 2),
+                                             ([('Emergency Postoperative Patients', '==', 'Y'), ('Immunocompromised State', '==', 'Y')], 5),
+                                             ([('Non Operative Patients', '==', 'Y'), ('Immunocompromised State', '==', 'Y')], 5)],
+                                   'default': 0},
+    }
+}
+
+#Pitt Bacteremia score as published: a missing temperature scores 2 points, and the ventilation check of the original script
+#tested 'Ventilator' against the row index instead of the O2 Inhalation Method values, so it never awarded its points
+PittTable = {
+    'score': 'Pitt Bacteremia score',
+    'rules': {
+        'PB Temp Subscore': {'bins': {'column': 'Body Temperature', 'cuts': [35.1, 36.1, 39, 40], 'points': [2, 1, 0, 1, 2], 'missing': 2}},
+        'PB HTN Subscore': {'cases': [([('SBP', '<', 90)], 2), ([('Total Dosage', '>', 0)], 2)], 'default': 0},
+        'PB Ventilation Subscore': {'cases': [([('O2 Inhalation Method', 'contains', 'Ventilator')], 0)], 'default': 0},
+        'PB Cardiac Arrest Subscore': {'cases': [([('Cardiac Arrest Status', '==', 'Y')], 4)], 'default': 0},
+        'PB Mental Subscore': {'cases': [([('Mental Status', '==', 'Comatose')], 4),
+                                         ([('Mental Status', '==', 'Stuporous')], 2),
+                                         ([('Mental Status', '==', 'Disoriented')], 1)],
+                               'default': 0},
+    }
+}
+
+#Corrected Pitt Bacteremia score: 2 points for patients on a ventilator and 0 points for a missing temperature, which is
+#flagged as missing like the APACHE II inputs
+PittCorrectedTable = {
+    'score': 'Pitt Bacteremia score',
+    'rules': {**PittTable['rules'],
+              'PB Temp Subscore': {'bins': {'column': 'Body Temperature', 'cuts': [35.1, 36.1, 39, 40], 'points': [2, 1, 0, 1, 2]}},
+              'PB Ventilation Subscore': {'cases': [([('O2 Inhalation Method', 'contains', 'Ventilator')], 2)], 'default': 0}}
+}
+
+qSOFATable = {
+    'score': 'qSOFA score',
+    'rules': {
+        'qSOFA RR Subscore': {'cases': [([('Respiratory Rate', '>=', 22)], 1)], 'default': 0},
+        'qSOFA SBP Subscore': {'cases': [([('SBP', '<=', 100)], 1)], 'default': 0},
+        'qSOFA Mental Subscore': {'cases': [([('GCS Score', '<', 15)], 1)], 'default': 0},
+    }
+}
+
+SIRSTable = {
+    'score': 'SIRS score',
+    'rules': {
+        'SIRS Temp Subscore': {'bins': {'column': 'Body Temperature', 'cuts': [36, 38], 'points': [1, 0, 1], 'closed': ['left', 'right']}},
+        'SIRS HR Subscore': {'cases': [([('Heart Rate', '>', 90)], 1)], 'default': 0},
+        'SIRS RR Subscore': {'cases': [([('Respiratory Rate', '>', 20)], 1)], 'default': 0},
+        'SIRS WBC Subscore': {'bins': {'column': 'WBC', 'cuts': [4, 12], 'points': [1, 0, 1], 'closed': ['left', 'right']}},
+    }
+}
+
+#Cardiovascular SOFA from an infusion log: the maximum concurrent weight-normalized rate of every vasopressor is scored and the
+#worst drug wins, a rate of 0 means the drug was not given, without vasopressors the MAP rule applies
+#A missing rate (a patient on vasopressors without a body weight) falls back to the Dosage Type and Total Dosage rule of SOFATable
+VasopressorDrugs = ['Dopamine', 'Dobutamine', 'Norpin', 'Epinephrine']
+SOFAInfusionTable = {
+    'score': 'SOFA score',
+    'rules': {**SOFATable['rules'],
+              'Cardio SOFA Subscore': {'switch': ([(drug + ' Rate', '>=', 0) for drug in VasopressorDrugs],
+                                                  {'max': [{'cases': [([('MAP', '>', 70)], 0)], 'default': 1},
+                                                           {'bins': {'column': 'Dopamine Rate', 'cuts': [0, 5], 'points': [0, 2, 4], 'closed': 'right'}},
+                                                           {'bins': {'column': 'Dobutamine Rate', 'cuts': [0, 5], 'points': [0, 2, 3], 'closed': 'right'}},
+                                                           {'bins': {'column': 'Norpin Rate', 'cuts': [0, 0.1], 'points': [0, 3, 4], 'closed': 'right'}},
+                                                           {'bins': {'column': 'Epinephrine Rate', 'cuts': [0, 0.1], 'points': [0, 3, 4], 'closed': 'right'}}]},
+                                                  SOFATable['rules']['Cardio SOFA Subscore'])}}
+}
+
+ScoreTables = {'SOFA': SOFATable, 'SOFA Infusion': SOFAInfusionTable, 'APACHE II': APACHETable, 'Pitt Bacteremia': PittTable, 'Pitt Bacteremia Corrected': PittCorrectedTable, 'qSOFA': qSOFATable, 'SIRS': SIRSTable}
+
+SOFASubscores = list(SOFATable['rules'])
+APACHESubscores = list(APACHETable['rules'])
+PittSubscores = list(PittTable['rules'])
+
+_Comparisons = {'<': np.less, '<=': np.less_equal, '>': np.greater, '>=': np.greater_equal}
+
+
+def _condition_columns(conditions):
+    """Return the (column, kind) inputs read by a list of conditions."""
+    return [(column, 'numeric' if operator in _Comparisons else 'text') for column, operator, value in conditions]
+
+
+def _compile_conditions(conditions):
+    """Compile a list of (column, operator, value) tuples into a function of the column cache returning a boolean mask."""
+    for column, operator, value in conditions:
+        if operator not in _Comparisons and operator not in ('==', '!=', 'contains'):
+            raise ValueError('Unknown operator in score table: ' + str(operator))
+
+    def evaluate(Columns):
+        mask = True
+        for column, operator, value in conditions:
+            if operator in _Comparisons:
+                result = _Comparisons[operator](Columns[column, 'numeric'], value)
+            elif operator == '==':
+                result = Columns[column, 'text'] == value
+            elif operator == '!=':
+                result = Columns[column, 'text'] != value
+            else:
+                result = pd.Series(Columns[column, 'text']).str.contains(value, regex=False, na=False).to_numpy(dtype=bool)
+            mask = mask & result
+        return mask
+    return evaluate
+
+
+def _compile_bins(spec):
+    """
+    Compile a 'bins' spec into a single searchsorted lookup.
+    Right-closed cut points are moved up by one ulp so that every range can be looked up as [lower, upper).
+    """
+    column = spec['column']
+    cuts = np.asarray(spec['cuts'], dtype=float)
+    closed = np.broadcast_to(np.asarray(spec.get('closed', 'left'), dtype=object), cuts.shape)
+    cuts = np.where(closed == 'right', np.nextafter(cuts, np.inf), cuts)
+    points = np.asarray(spec['points'], dtype=np.int64)
+    if np.any(np.diff(cuts) <= 0):
+        raise ValueError('Cut points must be strictly increasing for ' + column)
+    if len(points) != len(cuts) + 1:
+        raise ValueError('Expected one point value per range for ' + column)
+    missingPoints = spec.get('missing', 0)
+
+    def evaluate(Columns):
+        values = Columns[column, 'numeric']
+        missing = np.isnan(values)
+        score = np.where(missing, missingPoints, points[np.searchsorted(cuts, values, side='right')])
+        return score, missing
+    return evaluate, [(column, 'numeric')]
+
+
+def _compile_rule(rule):
+    """Compile one subscore rule into a function of the column cache returning (points, missing mask), plus the columns it reads."""
+    if 'max' in rule:
+        compiled = [_compile_rule(part) for part in rule['max']]
+
+        def evaluate(Columns):
+            results = [evaluatePart(Columns) for evaluatePart, columns in compiled]
+            return np.max([score for score, missing in results], axis=0), np.all([missing for score, missing in results], axis=0)
+        return evaluate, [column for evaluatePart, columns in compiled for column in columns]
+
+    if 'switch' in rule:
+        conditions, ruleTrue, ruleFalse = rule['switch']
+        test = _compile_conditions(conditions)
+        evaluateTrue, columnsTrue = _compile_rule(ruleTrue)
+        evaluateFalse, columnsFalse = _compile_rule(ruleFalse)
+
+        def evaluate(Columns):
+            selected = test(Columns)
+            scoreTrue, missingTrue = evaluateTrue(Columns)
+            scoreFalse, missingFalse = evaluateFalse(Columns)
+            return np.where(selected, scoreTrue, scoreFalse), np.where(selected, missingTrue, missingFalse)
+        return evaluate, _condition_columns(conditions) + columnsTrue + columnsFalse
+
+    if 'cases' in rule:
+        tests = [_compile_conditions(conditions) for conditions, points in rule['cases']]
+        points = [points for conditions, points in rule['cases']]
+        default = rule.get('default', 0)
+
+        def evaluate(Columns):
+            rows = len(next(iter(Columns.values())))
+            masks = [np.broadcast_to(test(Columns), rows) for test in tests]
+            return np.select(masks, points, default=default).astype(np.int64), np.zeros(rows, dtype=bool)
+        return evaluate, [column for conditions, points in rule['cases'] for column in _condition_columns(conditions)]
+
+    lookup, columns = _compile_bins(rule['bins'])
+    require = _compile_conditions(rule['require']) if 'require' in rule else None
+    otherwise = rule.get('otherwise', 0)
+    multiply = (_compile_conditions(rule['multiply'][0]), rule['multiply'][1]) if 'multiply' in rule else None
+    columns = columns + _condition_columns(rule.get('require', [])) + _condition_columns(rule['multiply'][0] if multiply else [])
+
+    def evaluate(Columns):
+        score, missing = lookup(Columns)
+        if require is not None:
+            required = require(Columns)
+            score = np.where(required, score, otherwise)
+            missing = missing & required
+        if multiply is not None:
+            score = np.where(multiply[0](Columns), score * multiply[1], score)
+        return score, missing
+    return evaluate, columns
+
+
+def compile_tables(Tables):
+    """
+    Compile score tables into a list of (score name, [(subscore name, evaluate)]) pairs.
+    Also returns the (column, kind) inputs read by all of the tables, each listed once.
+    """
+    Compiled = []
+    Inputs = []
+    for Table in Tables:
+        Rules = []
+        for name, rule in Table['rules'].items():
+            evaluate, columns = _compile_rule(rule)
+            Rules.append((name, evaluate))
+            Inputs += [column for column in columns if column not in Inputs]
+        Compiled.append((Table['score'], Rules))
+    return Compiled, Inputs
+
+
+def _read_columns(Data, Inputs):
+    """Read every input column of Data once into the column cache used by the compiled rules."""
+    Columns = {}
+    for column, kind in Inputs:
+        if kind == 'numeric':
+            Columns[column, kind] = pd.to_numeric(Data[column], errors='coerce').to_numpy(dtype=float)
+        else:
+            Columns[column, kind] = Data[column].to_numpy(dtype=object)
+    return Columns
+
+
+def compute_scores(Data, Scores=('SOFA', 'APACHE II', 'Pitt Bacteremia')):
+    """
+    Evaluate the named score tables over Data in one pass, a score table dict can be passed in place of a name.
+    Returns (Subscores, Missing): Subscores holds every subscore column followed by its total, and Missing is a boolean
+    frame with one column per subscore marking rows whose inputs were missing.
+    """
+    Compiled, Inputs = compile_tables([ScoreTables[score] if isinstance(score, str) else score for score in Scores])
+    Columns = _read_columns(Data, Inputs)
+    Subscores = {}
+    Missing = {}
+    for score, Rules in Compiled:
+        total = np.zeros(len(Data), dtype=np.int64)
+        for name, evaluate in Rules:
+            Subscores[name], Missing[name] = evaluate(Columns)
+            total = total + Subscores[name]
+        Subscores[score] = total
+    return pd.DataFrame(Subscores, index=Data.index), pd.DataFrame(Missing, index=Data.index)
+
+
+def sofa_scores(Data):
+    """Compute the six organ subscores and the total SOFA score for every row of Data."""
+    return compute_scores(Data, ['SOFA'])[0]
+
+
+def apache_ii_scores(Data):
+    """
+    Compute the fourteen APACHE II subscores and the total APACHE II score for every row of Data.
+    Returns (Scores, Missing) as compute_scores does, missing inputs contribute 0 points.
+    """
+    return compute_scores(Data, ['APACHE II'])
+
+
+def pitt_bacteremia_scores(Data):
+    """Compute the five Pitt Bacteremia subscores and the total Pitt Bacteremia score for every row of Data."""
+    return compute_scores(Data, ['Pitt Bacteremia'])[0]
+
+
+#Values assumed before the first charted vasopressor, transfusion or dialysis record of a patient in the time-series mode
+SOFATimeSeriesDefaults = {'Dosage Type': 'None', 'Total Dosage': 0, 'Platelet Concentration Transfusion Status': 'N', 'Hemodialysis Status': 'N'}
+
+
+def rolling_sofa(Observations, window='24h', defaults=None):
+    """
+    Time-series SOFA over long-format observations with 'Serial Number', 'Time', 'Variable' and 'Value' columns,
+    where Variable holds the ClinicalData column name of each measurement (e.g. 'Platelets', 'PaO2/FiO2').
+    Inputs are carried forward within each patient, every component is scored at each observation time, and the worst
+    value of each component over the trailing window is summed into the rolling SOFA score.
+    Returns (Rolling, Summary): Rolling has one row per patient and observation time with the worst-in-window subscores
+    and 'SOFA score'; Summary has one row per patient with the SOFA of the first window as 'Baseline SOFA', the highest
+    rolling SOFA as 'Peak SOFA', their difference 'Delta SOFA' and the Sepsis-3 criterion 'Delta SOFA' >= 2.
+    """
+    defaults = SOFATimeSeriesDefaults if defaults is None else defaults
+    window = pd.Timedelta(window)
+    inputs = sorted({column for column, kind in compile_tables([SOFATable])[1]})
+
+    #One row per patient and observation time, with the last value charted at that time for each input
+    Observations = Observations.loc[Observations['Variable'].isin(inputs), ['Serial Number', 'Time', 'Variable', 'Value']]
+    Wide = Observations.groupby(['Serial Number', 'Time', 'Variable'], sort=True)['Value'].last().unstack('Variable')
+    Wide = Wide.reindex(columns=inputs).groupby(level='Serial Number').ffill()
+    for column, value in defaults.items():
+        Wide[column] = Wide[column].fillna(value)
+
+    #Components without a measurement yet score 0 rather than the table's missing points
+    Subscores, Missing = compute_scores(Wide, ['SOFA'])
+    Subscores = Subscores[SOFASubscores].mask(Missing, 0)
+    NoMAP = (Wide['Dosage Type'] == 'None').to_numpy() & pd.to_numeric(Wide['MAP'], errors='coerce').isna().to_numpy()
+    Subscores.loc[NoMAP, 'Cardio SOFA Subscore'] = 0
+    Subscores = Subscores.reset_index()
+
+    #Worst value of each component over the trailing window, computed group-wise by the rolling kernels
+    #Rows are sorted by patient and time, so the grouped result comes back in the same row order
+    Worst = Subscores.groupby('Serial Number', sort=False).rolling(window, on='Time')[SOFASubscores].max()
+    Rolling = Subscores[['Serial Number', 'Time']].copy()
+    Rolling[SOFASubscores] = Worst[SOFASubscores].to_numpy(dtype=np.int64)
+    Rolling['SOFA score'] = Rolling[SOFASubscores].sum(axis=1)
+
+    Patients = Rolling.groupby('Serial Number', sort=True)
+    FirstWindow = Rolling['Time'] < Patients['Time'].transform('first') + window
+    Summary = pd.DataFrame({'Baseline SOFA': Rolling[FirstWindow].groupby('Serial Number', sort=True)['SOFA score'].last(),
+                            'Peak SOFA': Patients['SOFA score'].max()})
+    Summary['Delta SOFA'] = Summary['Peak SOFA'] - Summary['Baseline SOFA']
+    Summary['Sepsis-3 SOFA Criterion'] = Summary['Delta SOFA'] >= 2
+    return Rolling, Summary
+
+
+def vasopressor_rates(Infusions, weights=None):
+    """
+    Maximum concurrent infusion rate of each vasopressor per patient from an infusion log with 'Serial Number', 'Drug',
+    'Start', 'Stop' and 'Rate' columns, where Drug uses the Dosage Type codes in VasopressorDrugs.
+    Rates are divided by the patient's weight when weights (a Series of body weights indexed by Serial Number) is given,
+    the drugs of a patient without a weight are NaN instead of being left out.
+    Overlapping records of the same drug add up, a record without a Stop time runs until the end of the log.
+    Returns a frame indexed by Serial Number with one '<Drug> Rate' column per vasopressor, 0 for drugs not given.
+    """
+    Infusions = Infusions[Infusions['Drug'].isin(VasopressorDrugs)]
+    start = pd.to_datetime(Infusions['Start']).to_numpy(dtype='datetime64[ns]').view('int64')
+    stop = pd.to_datetime(Infusions['Stop']).to_numpy(dtype='datetime64[ns]').view('int64')
+    stop = np.where(stop == np.iinfo(np.int64).min, np.iinfo(np.int64).max, stop)
+    rate = np.nan_to_num(pd.to_numeric(Infusions['Rate'], errors='coerce').to_numpy(dtype=float))
+    keep = (stop > start) & (rate > 0)
+    if weights is not None:
+        rate = rate / weights.reindex(Infusions['Serial Number']).to_numpy(dtype=float)
+    patients, patient = np.unique(Infusions['Serial Number'].to_numpy()[keep], return_inverse=True)
+    drug = pd.Categorical(Infusions['Drug'], categories=VasopressorDrugs).codes[keep]
+    key = patient.astype(np.int64) * len(VasopressorDrugs) + drug
+    weighed = np.isfinite(rate[keep])
+
+    #Sweep the start (+rate) and stop (-rate) events of every patient and drug in time order, stops first at equal times
+    #so that back-to-back records are not counted as concurrent
+    count = int(weighed.sum())
+    eventKey = np.concatenate([key[weighed], key[weighed]])
+    eventTime = np.concatenate([start[keep][weighed], stop[keep][weighed]])
+    eventRate = np.concatenate([rate[keep][weighed], -rate[keep][weighed]])
+    eventOrder = np.concatenate([np.ones(count, dtype=np.int8), np.zeros(count, dtype=np.int8)])
+    order = np.lexsort((eventOrder, eventTime, eventKey))
+    eventKey = eventKey[order]
+    level = pd.Series(eventRate[order]).groupby(eventKey, sort=False).cumsum().to_numpy()
+    first = np.flatnonzero(np.r_[True, eventKey[1:] != eventKey[:-1]]) if count else np.zeros(0, dtype=np.intp)
+
+    peaks = np.zeros((len(patients), len(VasopressorDrugs)))
+    if count:
+        peaks[eventKey[first] // len(VasopressorDrugs), eventKey[first] % len(VasopressorDrugs)] = np.maximum.reduceat(level, first)
+    peaks[patient[~weighed], drug[~weighed]] = np.nan
+    return pd.DataFrame(peaks, index=pd.Index(patients, name='Serial Number'), columns=[drug + ' Rate' for drug in VasopressorDrugs])